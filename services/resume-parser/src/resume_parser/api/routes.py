@@ -2,14 +2,16 @@
 
 import time
 import uuid
-from typing import Optional
+from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException, UploadFile, File, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
+from ..core.config import get_settings
 from ..core.extractor import TextExtractor
-from ..core.parser import ResumeParser
+from ..core.parser import get_parser
 from ..core.models import (
-    ResumeUploadResponse, HealthCheckResponse, ErrorResponse,
+    ResumeUploadResponse, BatchUploadResponse, HealthCheckResponse, ErrorResponse,
     create_error_response, create_health_response, FileType
 )
 from ..utils.logger import get_logger
@@ -18,9 +20,8 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
-# Initialize components
+# Initialize components (the parser is created lazily via get_parser)
 text_extractor = TextExtractor()
-resume_parser = ResumeParser()
 
 def get_request_id() -> str:
     """Generate a unique request ID for tracking."""
@@ -58,10 +59,10 @@ async def upload_resume(
         
         # Determine file type from extension
         file_extension = file.filename.lower().split('.')[-1]
-        if file_extension not in ['pdf', 'docx', 'txt']:
+        if file_extension not in TextExtractor.SUPPORTED_TYPES:
             raise HTTPException(
                 status_code=400, 
-                detail=f"Unsupported file type: {file_extension}. Supported types: pdf, docx, txt"
+                detail=f"Unsupported file type: {file_extension}. Supported types: {', '.join(TextExtractor.SUPPORTED_TYPES)}"
             )
         
         # Read file content
@@ -82,7 +83,7 @@ async def upload_resume(
                    request_id=request_id)
         
         # Parse resume text
-        parsed_data = resume_parser.parse(extracted_text)
+        parsed_data = get_parser().parse(extracted_text)
         
         # Merge extraction metadata with parsing metadata
         parsed_data['metadata'].update({
@@ -128,6 +129,129 @@ async def upload_resume(
                     request_id=request_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/parse-batch", response_model=BatchUploadResponse)
+async def parse_resume_batch(
+    files: List[UploadFile] = File(...),
+    request_id: str = Depends(get_request_id)
+) -> BatchUploadResponse:
+    """
+    Upload and parse several resume files in one request.
+    
+    Text extraction runs per file; the LLM parsing of all valid files is
+    issued concurrently on a worker thread so the event loop stays free.
+    Files that fail validation, extraction or parsing are reported
+    individually without failing the rest of the batch.
+    
+    Args:
+        files: Uploaded resume files (PDF, DOCX, or TXT)
+        request_id: Unique request identifier
+        
+    Returns:
+        Per-file parse results in upload order
+        
+    Raises:
+        HTTPException: For oversized batches or if the parser is unavailable
+    """
+    start_time = time.time()
+    settings = get_settings()
+    
+    logger.info("Batch resume upload request received",
+                file_count=len(files),
+                request_id=request_id)
+    
+    if len(files) > settings.max_batch_files:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch contains {len(files)} files, maximum is {settings.max_batch_files}"
+        )
+    
+    responses: Dict[int, ResumeUploadResponse] = {}
+    texts: List[str] = []
+    pending: List[int] = []
+    metadata_by_index: Dict[int, dict] = {}
+    
+    for index, file in enumerate(files):
+        try:
+            file_extension = (file.filename or '').lower().split('.')[-1]
+            if not file.filename or file_extension not in TextExtractor.SUPPORTED_TYPES:
+                raise ValueError(f"Unsupported file type: {file_extension}. Supported types: {', '.join(TextExtractor.SUPPORTED_TYPES)}")
+            
+            file_content = await file.read()
+            # PDF/DOCX parsing is CPU-bound; keep it off the event loop
+            extracted_text, extraction_metadata = await run_in_threadpool(
+                text_extractor.extract, file_content, file_extension
+            )
+        except (ValueError, RuntimeError) as e:
+            logger.error("Batch file rejected",
+                        filename=file.filename,
+                        error=str(e),
+                        request_id=request_id)
+            responses[index] = ResumeUploadResponse(
+                success=False,
+                error_message=str(e),
+                processing_time_ms=(time.time() - start_time) * 1000
+            )
+            continue
+        
+        texts.append(extracted_text)
+        pending.append(index)
+        metadata_by_index[index] = extraction_metadata
+    
+    try:
+        parsed_batch = await run_in_threadpool(get_parser().parse_batch, texts) if texts else []
+    except Exception as e:
+        logger.error("Unexpected error during batch resume parsing",
+                    error=str(e),
+                    request_id=request_id)
+        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    processing_time_ms = (time.time() - start_time) * 1000
+    parsed_count = 0
+    
+    for index, parsed_data in zip(pending, parsed_batch):
+        if isinstance(parsed_data, Exception):
+            logger.error("Batch file parsing failed",
+                        filename=files[index].filename,
+                        error=str(parsed_data),
+                        request_id=request_id)
+            # Same exposure rules as the single upload route
+            if isinstance(parsed_data, (ValueError, RuntimeError)):
+                error_message = str(parsed_data)
+            else:
+                error_message = "Internal server error"
+            responses[index] = ResumeUploadResponse(
+                success=False,
+                error_message=error_message,
+                processing_time_ms=processing_time_ms
+            )
+            continue
+        
+        extraction_metadata = metadata_by_index[index]
+        parsed_data['metadata'].update({
+            'extraction_method': extraction_metadata.get('extraction_method'),
+            'encoding': extraction_metadata.get('encoding'),
+            'word_count': extraction_metadata.get('word_count')
+        })
+        responses[index] = ResumeUploadResponse(
+            success=True,
+            parsed_data=parsed_data,
+            processing_time_ms=processing_time_ms,
+            file_metadata=extraction_metadata
+        )
+        parsed_count += 1
+    
+    logger.info("Batch resume parsing completed",
+               processing_time_ms=processing_time_ms,
+               parsed_count=parsed_count,
+               failed_count=len(files) - parsed_count,
+               request_id=request_id)
+    
+    return BatchUploadResponse(
+        success=parsed_count == len(files),
+        results=[responses[index] for index in range(len(files))],
+        processing_time_ms=processing_time_ms
+    )
+
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check() -> HealthCheckResponse:
     """
@@ -137,9 +261,9 @@ async def health_check() -> HealthCheckResponse:
         Service health status and metadata
     """
     try:
-        # Check if spaCy model is loaded
-        if not hasattr(resume_parser, 'nlp') or resume_parser.nlp is None:
-            raise RuntimeError("spaCy model not loaded")
+        # Check that the LLM parser can be initialized
+        if get_parser().client is None:
+            raise RuntimeError("LLM client not initialized")
         
         # Calculate uptime (simplified - in production, track start time)
         uptime_seconds = 0.0  # TODO: Implement proper uptime tracking
@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     min_word_count: int = Field(default=100, description="Minimum word count requirement")
     min_content_words: int = Field(default=100, description="Minimum content words requirement")
     processing_timeout_seconds: int = Field(default=300, description="Processing timeout in seconds")
+    max_batch_files: int = Field(default=10, description="Maximum number of files per batch parse request")
     
     # Parsing settings
     confidence_threshold: float = Field(default=0.5, description="Minimum confidence threshold for extracted fields")
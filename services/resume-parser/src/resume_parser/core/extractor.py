@@ -13,6 +13,11 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Text cleaning patterns, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+# Control characters except newlines and tabs
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
 class TextExtractor:
     """Extracts text from PDF, DOCX, and TXT files with validation and cleaning."""
     
@@ -57,8 +62,11 @@ class TextExtractor:
         """
         self.logger.info("Starting text extraction", file_type=file_type, content_size=len(file_content))
         
+        # Normalize once; every check below works on the lowercase form
+        file_type = file_type.lower()
+        
         # Validate file type
-        if file_type.lower() not in self.SUPPORTED_TYPES:
+        if file_type not in self.SUPPORTED_TYPES:
             raise ValueError(f"Unsupported file type: {file_type}")
         
         # Validate file size
@@ -74,7 +82,7 @@ class TextExtractor:
              raise ValueError(f"Invalid file signature (magic bytes) for {file_type}")
         
         metadata = {
-            'file_type': file_type.lower(),
+            'file_type': file_type,
             'file_size': len(file_content),
             'extraction_method': None,
             'encoding': None,
@@ -84,13 +92,13 @@ class TextExtractor:
         
         try:
             # Extract text based on file type
-            if file_type.lower() == 'pdf':
+            if file_type == 'pdf':
                 text = self._extract_pdf(file_content)
                 metadata['extraction_method'] = 'pypdf2'
-            elif file_type.lower() == 'docx':
+            elif file_type == 'docx':
                 text = self._extract_docx(file_content)
                 metadata['extraction_method'] = 'python-docx'
-            elif file_type.lower() == 'txt':
+            elif file_type == 'txt':
                 text, encoding = self._extract_txt(file_content)
                 metadata['extraction_method'] = 'text-encoding-detection'
                 metadata['encoding'] = encoding
@@ -152,14 +160,14 @@ class TextExtractor:
             for page_num, page in enumerate(pdf_reader.pages):
                 try:
                     # Use visitor to extract text in reading order if possible
-                    # This approximates simple column handling
-                    page.extract_text(visitor_text=visitor_body)
-                    
+                    # This approximates simple column handling. The return value
+                    # is the plain extraction of the same content stream, so keep
+                    # it for the fallback instead of parsing the page twice
+                    page_text = page.extract_text(visitor_text=visitor_body)
+
                     # Fallback if visitor yielded nothing (e.g. image-based or weird font map)
-                    if not text_parts: 
-                         page_text = page.extract_text()
-                         if page_text:
-                            text_parts.append(page_text)
+                    if not text_parts and page_text:
+                        text_parts.append(page_text)
                             
                 except Exception as e:
                     self.logger.warning("Failed to extract text from page", 
@@ -265,14 +273,11 @@ class TextExtractor:
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove excessive newlines
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        # Collapse all whitespace (newlines included) to single spaces
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove control characters except newlines and tabs
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        text = _CONTROL_CHARS_RE.sub('', text)
         
         # Normalize unicode characters
         text = text.encode('ascii', 'ignore').decode('ascii')
@@ -300,12 +305,11 @@ class TextExtractor:
         
         Args:
             content: File content bytes
-            file_type: File extension
+            file_type: Lowercase file extension
             
         Returns:
             True if valid or no magic bytes defined, False otherwise
         """
-        file_type = file_type.lower()
         if file_type not in self.MAGIC_BYTES or not self.MAGIC_BYTES[file_type]:
             return True # No magic bytes to check for this type (e.g. txt)
             
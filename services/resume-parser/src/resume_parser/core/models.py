@@ -102,6 +102,12 @@ class ResumeUploadResponse(BaseModel):
     processing_time_ms: float = Field(description="Time taken to process the resume in milliseconds")
     file_metadata: Optional[Dict[str, Any]] = Field(None, description="File processing metadata")
 
+class BatchUploadResponse(BaseModel):
+    """Response model for batch resume upload endpoint."""
+    success: bool = Field(description="Whether every file in the batch was parsed")
+    results: List[ResumeUploadResponse] = Field(default_factory=list, description="Per-file results in upload order")
+    processing_time_ms: float = Field(description="Time taken to process the whole batch in milliseconds")
+
 class HealthCheckResponse(BaseModel):
     """Response model for health check endpoint."""
     status: str = Field(description="Service status")
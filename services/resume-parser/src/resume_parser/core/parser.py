@@ -1,18 +1,24 @@
 """Resume parsing using LLMs to extract structured data from text."""
 
 import os
-import json
 import re
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
-import structlog
 from pydantic import BaseModel, Field
-from openai import OpenAI
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fallback patterns for profile links the LLM missed, combined so the resume
+# text is scanned once: linkedin.com/in/username or github.com/username
+SOCIAL_LINK_PATTERN = re.compile(
+    r'(?P<linkedin>https?://(?:www\.)?linkedin\.com/in/[\w\-%]+)'
+    r'|(?P<github>https?://(?:www\.)?github\.com/[a-zA-Z0-9\-]+)',
+    re.IGNORECASE
+)
+
 # --- Pydantic Models for Structured Output ---
 
 class PersonalInfo(BaseModel):
@@ -58,8 +64,10 @@ class ResumeParser:
         """Initialize the ResumeParser with OpenAI client."""
         self.logger = logger
         
-        # Load environment variables
+        # Deferred imports: the OpenAI SDK is slow to import, so only pay for
+        # it when a parser is actually constructed
         from dotenv import load_dotenv
+        from openai import OpenAI
         
         # Try loading from current directory first, then root
         load_dotenv()
@@ -112,6 +120,36 @@ class ResumeParser:
             # Fallback or empty return? For now, re-raise or return empty structure
             raise e
 
+    def parse_batch(self, texts: List[str], max_workers: int = 8) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Parse several resume texts concurrently.
+
+        Each text is an independent LLM request, so the work is I/O bound and
+        the calls overlap well on a small thread pool. A failed request does
+        not discard the others: its exception is returned in its slot.
+
+        Args:
+            texts: Clean resume texts
+            max_workers: Upper bound on concurrent LLM requests
+
+        Returns:
+            For each entry of ``texts``, in the same order, either the parsed
+            dictionary or the exception raised while parsing it.
+        """
+        if not texts:
+            return []
+
+        self.logger.info("Starting LLM batch parsing", batch_size=len(texts))
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            futures = [executor.submit(self.parse, text) for text in texts]
+
+        results: List[Union[Dict[str, Any], Exception]] = []
+        for future in futures:
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        return results
+
     def _get_system_prompt(self) -> str:
         """Returns the system prompt for the LLM."""
         return """
@@ -143,7 +181,7 @@ class ResumeParser:
             'institutions': [edu.institution for edu in resume.education],
             'degrees': [edu.degree for edu in resume.education if edu.degree],
             'fields_of_study': [edu.field_of_study for edu in resume.education if edu.field_of_study],
-            'dates': [f"{edu.start_date} - {edu.end_date}" if edu.start_date and edu.end_date else (edu.end_date or edu.start_date or "") for edu in resume.education],
+            'dates': [self._format_date_range(edu.start_date, edu.end_date) for edu in resume.education],
             'gpa': {'value': resume.education[0].gpa if resume.education and resume.education[0].gpa else None, 'confidence': 1.0},
             'confidence': 1.0
         }
@@ -152,17 +190,21 @@ class ResumeParser:
         experience_data = {
             'companies': [exp.company for exp in resume.work_experience],
             'positions': [exp.position for exp in resume.work_experience],
-            'dates': [f"{exp.start_date} - {exp.end_date}" if exp.start_date and exp.end_date else (exp.end_date or exp.start_date or "") for exp in resume.work_experience],
+            'dates': [self._format_date_range(exp.start_date, exp.end_date) for exp in resume.work_experience],
             'descriptions': [exp.description for exp in resume.work_experience if exp.description],
             'confidence': 1.0
         }
 
         # Transform Personal Info
         # Fallback to regex extraction if LLM missed URLs
-        fallback_links = self._extract_social_links_fallback(original_text)
-        
-        linkedin_val = resume.personal_info.linkedin_url or fallback_links.get('linkedin')
-        github_val = resume.personal_info.github_url or fallback_links.get('github')
+        linkedin_val = resume.personal_info.linkedin_url
+        github_val = resume.personal_info.github_url
+
+        # Only rescan the full text when the LLM actually left a gap
+        if not (linkedin_val and github_val):
+            fallback_links = self._extract_social_links_fallback(original_text)
+            linkedin_val = linkedin_val or fallback_links.get('linkedin')
+            github_val = github_val or fallback_links.get('github')
 
         personal_info_data = {
             'name': {'value': resume.personal_info.name, 'confidence': 1.0},
@@ -195,22 +237,38 @@ class ResumeParser:
             }
         }
 
+    @staticmethod
+    def _format_date_range(start_date: Optional[str], end_date: Optional[str]) -> str:
+        """Format a start/end pair the way the legacy parser reported dates."""
+        if start_date and end_date:
+            return f"{start_date} - {end_date}"
+        return end_date or start_date or ""
+
     def _extract_social_links_fallback(self, text: str) -> Dict[str, Optional[str]]:
         """
         Extract social links using regex if LLM fails.
+        
+        Both link types are found in a single scan of the text; the first
+        match of each kind wins.
         """
         links = {'linkedin': None, 'github': None}
         
-        # LinkedIn regex
-        # Look for linkedin.com/in/username
-        linkedin_match = re.search(r'(https?://(?:www\.)?linkedin\.com/in/[\w\-%]+)', text, re.IGNORECASE)
-        if linkedin_match:
-            links['linkedin'] = linkedin_match.group(1)
-            
-        # GitHub regex
-        # Look for github.com/username
-        github_match = re.search(r'(https?://(?:www\.)?github\.com/[a-zA-Z0-9\-]+)', text, re.IGNORECASE)
-        if github_match:
-            links['github'] = github_match.group(1)
+        for match in SOCIAL_LINK_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if links[kind] is None:
+                links[kind] = match.group(kind)
+                if links['linkedin'] and links['github']:
+                    break
             
         return links
+
+
+# Global parser instance
+_parser: Optional[ResumeParser] = None
+
+def get_parser() -> ResumeParser:
+    """Get the shared ResumeParser singleton, creating it on first use."""
+    global _parser
+    if _parser is None:
+        _parser = ResumeParser()
+    return _parser
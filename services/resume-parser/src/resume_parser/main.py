@@ -1,5 +1,6 @@
 """Main FastAPI application for resume parser service."""
 
+import logging
 import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
@@ -9,7 +10,8 @@ import uvicorn
 
 from .api.routes import router
 from .core.config import get_settings
-from src.resume_parser.utils.logger import configure_logging, get_logger
+from .core.parser import get_parser
+from .utils.logger import configure_logging, get_logger
 
 # Configure logging
 configure_logging()
@@ -23,6 +25,8 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     logger.info("Starting resume parser service")
+    # Create the shared parser up front so the first request doesn't pay for it
+    get_parser()
     yield
     # Shutdown
     logger.info("Shutting down resume parser service")
@@ -60,24 +64,28 @@ def create_app() -> FastAPI:
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         """Log incoming requests and their processing time."""
-        start_time = time.time()
+        request_start = time.perf_counter()
         
-        # Log request
-        logger.info("Incoming request",
-                   method=request.method,
-                   url=str(request.url),
-                   client_ip=request.client.host if request.client else None)
+        # Skip building log fields entirely when INFO is filtered out
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        if log_enabled:
+            url = str(request.url)
+            logger.info("Incoming request",
+                       method=request.method,
+                       url=url,
+                       client_ip=request.client.host if request.client else None)
         
         # Process request
         response = await call_next(request)
         
         # Log response
-        process_time = time.time() - start_time
-        logger.info("Request completed",
-                   method=request.method,
-                   url=str(request.url),
-                   status_code=response.status_code,
-                   process_time_ms=process_time * 1000)
+        process_time = time.perf_counter() - request_start
+        if log_enabled:
+            logger.info("Request completed",
+                       method=request.method,
+                       url=url,
+                       status_code=response.status_code,
+                       process_time_ms=process_time * 1000)
         
         # Add processing time header
         response.headers["X-Process-Time"] = str(process_time)
@@ -6,16 +6,17 @@ that spaCy may incorrectly tag as ORG entities.
 """
 
 import re
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 
 
 # Keywords that indicate an educational institution (lowercase)
-EDUCATION_KEYWORDS: Set[str] = {
+EDUCATION_KEYWORDS: FrozenSet[str] = frozenset({
     'university', 'college', 'school', 'institute', 'academy',
     'gpa', 'bachelor', 'master', 'phd', 'degree', 'coursework',
     'expected', 'graduated', 'graduation', 'portfolio', 'education',
     'bootcamp', 'secondary', 'polytechnic',
-}
+})
 
 # Compiled regex patterns that match education-related entity names
 EDUCATION_PATTERNS = [
@@ -32,59 +33,126 @@ EDUCATION_PATTERNS = [
     re.compile(r'expected\s+.*\d{4}', re.IGNORECASE),
 ]
 
+# All of the above as one alternation, so a single search scans the text once
+_EDUCATION_COMBINED = re.compile(
+    '|'.join(f'(?:{p.pattern})' for p in EDUCATION_PATTERNS),
+    re.IGNORECASE,
+)
+
 # Skills / tools that spaCy frequently misclassifies as ORG (lowercase)
-SKILL_KEYWORDS: Set[str] = {
+SKILL_KEYWORDS: FrozenSet[str] = frozenset({
     'github', 'gitlab', 'docker', 'kubernetes', 'jenkins', 'aws',
     'azure', 'gcp', 'android', 'ios', 'linux', 'windows', 'macos',
     'python', 'java', 'javascript', 'typescript', 'react', 'angular',
     'django', 'flask', 'fastapi', 'mongodb', 'postgresql', 'mysql',
     'redis', 'elasticsearch', 'dynamodb', 'node.js', 'express',
     'spring', 'android development', 'compilers', 'data science',
-}
+})
 
 # Context words that suggest an education section
-_EDUCATION_CONTEXT_WORDS: Set[str] = {
+_EDUCATION_CONTEXT_WORDS: FrozenSet[str] = frozenset({
     'bachelor', 'master', 'phd', 'gpa', 'graduated', 'graduation',
     'degree', 'coursework', 'thesis', 'dean', 'honors', 'summa',
     'magna', 'cum laude', 'diploma', 'academic',
-}
+})
 
 # Context words that suggest an employment section
-_EMPLOYMENT_CONTEXT_WORDS: Set[str] = {
+_EMPLOYMENT_CONTEXT_WORDS: FrozenSet[str] = frozenset({
     'intern', 'engineer', 'developer', 'manager', 'director', 'lead',
     'architect', 'analyst', 'consultant', 'coordinator', 'specialist',
     'designed', 'built', 'implemented', 'developed', 'led', 'managed',
     'collaborated', 'deployed', 'responsible',
-}
+})
+
+
+def _keyword_alternation(keywords: FrozenSet[str]) -> str:
+    """Build a regex alternation of *keywords* shaped like a prefix trie.
+
+    Shared prefixes are factored out (``le(?:ad|d)`` rather than
+    ``lead|led``), so at each position the regex engine branches on the next
+    character instead of retrying every keyword. Where one keyword is a
+    prefix of another, the longer one is preferred.
+    """
+    trie: dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end-of-keyword marker
+
+    def emit(node: dict) -> str:
+        is_end = '' in node
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if is_end else group
+
+    return emit(trie)
+
+
+# Single-pass substring scanner for EDUCATION_KEYWORDS
+_EDUCATION_KEYWORD_PATTERN = re.compile(_keyword_alternation(EDUCATION_KEYWORDS))
+
+
+def _is_edu_lower(text_lower: str) -> bool:
+    """Core of ``is_educational_institution`` for already-lowercased text."""
+    if not text_lower or len(text_lower) < 2:
+        return False
+    # Only pay for strip() when there is whitespace to trim
+    if (text_lower[0].isspace() or text_lower[-1].isspace()) and len(text_lower.strip()) < 2:
+        return False
+
+    # Exact single-keyword names ("gpa", "university") need only a hash probe
+    if text_lower in EDUCATION_KEYWORDS:
+        return True
+
+    # Keyword check
+    if _EDUCATION_KEYWORD_PATTERN.search(text_lower):
+        return True
+
+    # Pattern check. Only a backstop: every pattern contains a word from
+    # EDUCATION_KEYWORDS, so it can only add a match when IGNORECASE
+    # case-folding differs from lower() (e.g. U+017F 'ſ' matching 's').
+    # This is also why the greedy ``expected\s+.*\d{4}`` is harmless: text
+    # containing 'expected' has already returned above, so the search fails
+    # on that literal and never reaches the backtracking ``.*``
+    return _EDUCATION_COMBINED.search(text_lower) is not None
+
 
+def _classify_scores(context_lower: str) -> Tuple[int, int]:
+    """Count distinct education and employment context words in *context_lower*.
 
+    A handful of C-level substring searches beats a single regex here: an
+    alternation over the context words has to be retried at every position.
+    """
+    edu_score = sum(1 for w in _EDUCATION_CONTEXT_WORDS if w in context_lower)
+    emp_score = sum(1 for w in _EMPLOYMENT_CONTEXT_WORDS if w in context_lower)
+    return edu_score, emp_score
+
+
+# The same ORG strings recur within and across resumes; results are pure
+# functions of the frozen tables above, so memoize them.
+@lru_cache(maxsize=4096)
 def is_educational_institution(text: str) -> bool:
     """Check whether *text* refers to an educational institution.
 
     Uses both keyword containment (any word from ``EDUCATION_KEYWORDS``
     appears inside *text*) and regex pattern matching against
-    ``EDUCATION_PATTERNS``.
+    ``EDUCATION_PATTERNS`` (searched as one combined pattern).
 
     Returns ``True`` if the text looks like an educational institution,
     ``False`` otherwise.
     """
-    if not text or len(text.strip()) < 2:
+    if not text:
         return False
 
-    text_lower = text.lower()
-
-    # Keyword check
-    if any(kw in text_lower for kw in EDUCATION_KEYWORDS):
-        return True
-
-    # Pattern check
-    for pattern in EDUCATION_PATTERNS:
-        if pattern.search(text_lower):
-            return True
-
-    return False
+    return _is_edu_lower(text.lower())
 
 
+@lru_cache(maxsize=1024)
 def classify_organization(org_name: str, context: str = "") -> str:
     """Classify an organisation name as ``'education'`` or ``'employment'``.
 
@@ -94,16 +162,17 @@ def classify_organization(org_name: str, context: str = "") -> str:
        education-context vs employment-context words in the surrounding text.
     3. If neither signal dominates, default to ``'employment'``.
     """
-    if is_educational_institution(org_name):
-        return 'education'
+    # Already memoized at this level, so go straight to the lowercase core.
+    # Known skill/tool names never look educational, so skip the scan.
+    if org_name:
+        org_lower = org_name.lower()
+        if org_lower not in SKILL_KEYWORDS and _is_edu_lower(org_lower):
+            return 'education'
 
     if not context:
         return 'employment'
 
-    context_lower = context.lower()
-
-    edu_score = sum(1 for w in _EDUCATION_CONTEXT_WORDS if w in context_lower)
-    emp_score = sum(1 for w in _EMPLOYMENT_CONTEXT_WORDS if w in context_lower)
+    edu_score, emp_score = _classify_scores(context.lower())
 
     if edu_score > emp_score:
         return 'education'
@@ -1,12 +1,9 @@
 """Integration tests for resume parser API endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 
-from resume_parser.main import app
-
-# Note: client fixture is now provided by conftest.py
+# Note: client fixture is provided by conftest.py
 
 class TestAPIEndpoints:
     """Test cases for API endpoints."""
@@ -61,9 +58,10 @@ class TestAPIEndpoints:
         assert "Empty file" in response.json()["detail"]
     
     @patch('resume_parser.api.routes.text_extractor')
-    @patch('resume_parser.api.routes.resume_parser')
-    def test_upload_success(self, mock_parser, mock_extractor, client):
+    @patch('resume_parser.api.routes.get_parser')
+    def test_upload_success(self, mock_get_parser, mock_extractor, client):
         """Test successful resume upload."""
+        mock_parser = mock_get_parser.return_value
         # Mock the extractor
         mock_extractor.extract.return_value = (
             "John Doe Software Engineer Python Java React " * 75,  # Ensure >150 words
@@ -155,6 +153,110 @@ class TestAPIEndpoints:
         assert "word_count" in metadata
         assert "extraction_errors" in metadata
     
+    @patch('resume_parser.api.routes.text_extractor')
+    @patch('resume_parser.api.routes.get_parser')
+    def test_parse_batch(self, mock_get_parser, mock_extractor, client):
+        """Test batch upload parses valid files and reports invalid ones."""
+        mock_parser = mock_get_parser.return_value
+        mock_extractor.extract.return_value = (
+            "John Doe Software Engineer Python Java React " * 75,
+            {
+                'file_type': 'txt',
+                'file_size': 1000,
+                'extraction_method': 'text-encoding-detection',
+                'encoding': 'utf-8',
+                'word_count': 300,
+                'extraction_errors': []
+            }
+        )
+        mock_parser.parse_batch.side_effect = lambda texts: [{
+            'personal_info': {'confidence': 0.0},
+            'education': {'confidence': 0.0},
+            'experience': {'confidence': 0.0},
+            'skills': {'confidence': 0.0},
+            'metadata': {
+                'total_words': 300,
+                'parsing_timestamp': '2024-01-01T00:00:00',
+                'confidence_overall': 1.0,
+                'extraction_errors': []
+            }
+        } for _ in texts]
+        
+        files = [
+            ("files", ("first.txt", b"John Doe Software Engineer " * 75, "text/plain")),
+            ("files", ("photo.jpg", b"fake content", "image/jpeg")),
+            ("files", ("second.txt", b"Jane Doe Data Scientist " * 75, "text/plain")),
+        ]
+        response = client.post("/api/v1/parse-batch", files=files)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == False
+        assert [r["success"] for r in data["results"]] == [True, False, True]
+        assert "Unsupported file type" in data["results"][1]["error_message"]
+        assert data["results"][0]["parsed_data"]["metadata"]["word_count"] == 300
+        assert len(mock_parser.parse_batch.call_args[0][0]) == 2
+    
+    @patch('resume_parser.api.routes.text_extractor')
+    @patch('resume_parser.api.routes.get_parser')
+    def test_parse_batch_partial_parse_failure(self, mock_get_parser, mock_extractor, client):
+        """Test a failed LLM call is reported per file and keeps the other results."""
+        mock_parser = mock_get_parser.return_value
+        mock_extractor.extract.return_value = (
+            "John Doe Software Engineer Python Java React " * 75,
+            {
+                'file_type': 'txt',
+                'file_size': 1000,
+                'extraction_method': 'text-encoding-detection',
+                'encoding': 'utf-8',
+                'word_count': 300,
+                'extraction_errors': []
+            }
+        )
+        mock_parser.parse_batch.return_value = [
+            {
+                'personal_info': {'confidence': 0.0},
+                'education': {'confidence': 0.0},
+                'experience': {'confidence': 0.0},
+                'skills': {'confidence': 0.0},
+                'metadata': {
+                    'total_words': 300,
+                    'parsing_timestamp': '2024-01-01T00:00:00',
+                    'confidence_overall': 1.0,
+                    'extraction_errors': []
+                }
+            },
+            RuntimeError("LLM request failed"),
+        ]
+        
+        files = [
+            ("files", ("first.txt", b"John Doe Software Engineer " * 75, "text/plain")),
+            ("files", ("second.txt", b"Jane Doe Data Scientist " * 75, "text/plain")),
+        ]
+        response = client.post("/api/v1/parse-batch", files=files)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == False
+        assert [r["success"] for r in data["results"]] == [True, False]
+        assert data["results"][1]["error_message"] == "LLM request failed"
+    
+    @patch('resume_parser.api.routes.get_parser')
+    def test_parse_batch_all_files_rejected(self, mock_get_parser, client):
+        """Test the parser is not called when no file survives extraction."""
+        files = [
+            ("files", ("photo.jpg", b"fake content", "image/jpeg")),
+            ("files", ("archive.zip", b"fake content", "application/zip")),
+        ]
+        response = client.post("/api/v1/parse-batch", files=files)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == False
+        assert [r["success"] for r in data["results"]] == [False, False]
+        mock_get_parser.assert_not_called()
+    
+    @pytest.mark.slow
     def test_upload_file_too_large(self, client):
         """Test upload with file exceeding size limit."""
         # Create a file larger than 5MB
@@ -9,41 +9,41 @@ from resume_parser.utils.education_filters import (
     SKILL_KEYWORDS,
     is_educational_institution,
     classify_organization,
+    _classify_scores,
 )
 
 
 class TestIsEducationalInstitution:
     """Tests for is_educational_institution()."""
 
-    def test_universities(self):
-        assert is_educational_institution("University of Maryland") is True
-        assert is_educational_institution("MIT University") is True
-        assert is_educational_institution("Stanford University") is True
-
-    def test_colleges(self):
-        assert is_educational_institution("Data Science College Park") is True
-        assert is_educational_institution("College of Engineering") is True
-
-    def test_schools(self):
-        assert is_educational_institution("Jefferson High School") is True
-
-    def test_companies_are_not_educational(self):
-        assert is_educational_institution("Google") is False
-        assert is_educational_institution("Meta Platforms") is False
-        assert is_educational_institution("TechCorp Inc.") is False
-
-    def test_edge_cases(self):
-        assert is_educational_institution("GPA") is True
-        assert is_educational_institution("Portfolio Education") is True
+    @pytest.mark.parametrize("text,expected", [
+        # Universities
+        ("University of Maryland", True),
+        ("MIT University", True),
+        ("Stanford University", True),
+        # Colleges
+        ("Data Science College Park", True),
+        ("College of Engineering", True),
+        # Schools
+        ("Jefferson High School", True),
+        # Companies are not educational
+        ("Google", False),
+        ("Meta Platforms", False),
+        ("TechCorp Inc.", False),
+        # Edge cases
+        ("GPA", True),
+        ("Portfolio Education", True),
         # Short / empty strings
-        assert is_educational_institution("") is False
-        assert is_educational_institution("A") is False
-        assert is_educational_institution("   ") is False
-
-    def test_pattern_matching(self):
-        assert is_educational_institution("University of California") is True
-        assert is_educational_institution("Bachelor of Science") is True
-        assert is_educational_institution("Expected May 2025") is True
+        ("", False),
+        ("A", False),
+        ("   ", False),
+        # Pattern matching
+        ("University of California", True),
+        ("Bachelor of Science", True),
+        ("Expected May 2025", True),
+    ])
+    def test_is_educational_institution(self, text, expected):
+        assert is_educational_institution(text) is expected
 
 
 class TestClassifyOrganization:
@@ -73,6 +73,32 @@ class TestClassifyOrganization:
         assert classify_organization("", "some neutral words") == "employment"
 
 
+class TestClassifyScores:
+    """Tests for the _classify_scores() helper."""
+
+    def test_counts_distinct_words(self):
+        assert _classify_scores("bachelor gpa graduated") == (3, 0)
+        assert _classify_scores("engineer engineer built") == (0, 2)
+        assert _classify_scores("") == (0, 0)
+
+
+class TestCaching:
+    """Verify repeated lookups are served from the memoization cache."""
+
+    def test_is_educational_institution_cached(self):
+        is_educational_institution.cache_clear()
+        assert is_educational_institution("Stanford University") is True
+        assert is_educational_institution("Stanford University") is True
+        assert is_educational_institution.cache_info().hits == 1
+
+    def test_classify_organization_cached(self):
+        classify_organization.cache_clear()
+        context = "Worked as a senior engineer"
+        assert classify_organization("Acme Corp", context) == "employment"
+        assert classify_organization("Acme Corp", context) == "employment"
+        assert classify_organization.cache_info().hits == 1
+
+
 class TestKeywordSets:
     """Verify the exported keyword sets are non-empty and well-formed."""
 
@@ -84,6 +110,10 @@ class TestKeywordSets:
         assert len(SKILL_KEYWORDS) > 0
         assert all(kw == kw.lower() for kw in SKILL_KEYWORDS)
 
+    def test_skill_keywords_are_not_educational(self):
+        # classify_organization skips the education scan for exact skill names
+        assert not any(is_educational_institution(kw) for kw in SKILL_KEYWORDS)
+
     def test_education_patterns_non_empty(self):
         assert len(EDUCATION_PATTERNS) > 0
 
@@ -1,9 +1,41 @@
 """Unit tests for TextExtractor class."""
 
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 from resume_parser.core.extractor import TextExtractor
 
+# Shared test payloads, built once at import rather than in every test
+_TXT_UTF8 = b"This is a test resume with more than 100 words. " * 75  # Ensure >150 words
+_ENCODING_TEXT = "Test resume content with more words to meet minimum requirement. " * 15
+_ENCODING_TEXT_UTF8 = _ENCODING_TEXT.encode('utf-8')
+_ENCODING_TEXT_LATIN1 = _ENCODING_TEXT.encode('latin-1')
+_PDF_TEXT = "Test PDF content with more words to meet minimum requirement. " * 25
+_DOCX_TEXT = "Test DOCX content with more words to meet minimum requirement. " * 25
+
+# Content with real file signatures so extract() gets past the magic-byte check
+_PDF_CONTENT = b"%PDF-1.4 fake pdf content"
+_DOCX_CONTENT = b"PK\x03\x04 fake docx content"
+
+
+# Minimal PyPDF2 / python-docx stand-ins carrying only what extract() reads
+_PDF_READER = SimpleNamespace(
+    is_encrypted=False,
+    pages=[SimpleNamespace(extract_text=lambda visitor_text=None: _PDF_TEXT)],
+)
+_ENCRYPTED_PDF_READER = SimpleNamespace(is_encrypted=True, pages=[])
+_DOCX_DOCUMENT = SimpleNamespace(paragraphs=[SimpleNamespace(text=_DOCX_TEXT)], tables=[])
+
+
+class _FakeBytes(bytes):
+    """Empty bytes that report a length just over the extractor's size limit.
+
+    extract() checks len() before reading the content, so the size-limit test
+    does not need to allocate a multi-megabyte buffer.
+    """
+
+    def __len__(self):
+        return TextExtractor.MAX_FILE_SIZE + 1
+
 class TestTextExtractor:
     """Test cases for TextExtractor class."""
     
@@ -38,14 +70,13 @@ class TestTextExtractor:
     
     def test_extract_file_too_large(self):
         """Test extraction with file exceeding size limit."""
-        large_content = b"x" * (self.extractor.MAX_FILE_SIZE + 1)
+        large_content = _FakeBytes(b"")
         with pytest.raises(ValueError, match="exceeds maximum"):
             self.extractor.extract(large_content, "txt")
     
     def test_extract_txt_success(self):
         """Test successful TXT file extraction."""
-        content = b"This is a test resume with more than 100 words. " * 75  # Ensure >150 words
-        text, metadata = self.extractor.extract(content, "txt")
+        text, metadata = self.extractor.extract(_TXT_UTF8, "txt")
         
         assert isinstance(text, str)
         assert len(text) > 0
@@ -57,13 +88,11 @@ class TestTextExtractor:
     def test_extract_txt_encoding_detection(self):
         """Test TXT file with different encodings."""
         # Test with UTF-8
-        content = "Test resume content with more words to meet minimum requirement. " * 15
-        text, metadata = self.extractor.extract(content.encode('utf-8'), "txt")
+        text, metadata = self.extractor.extract(_ENCODING_TEXT_UTF8, "txt")
         assert metadata['encoding'] == 'utf-8'
         
         # Test with Latin-1
-        content = "Test resume content with more words to meet minimum requirement. " * 15
-        text, metadata = self.extractor.extract(content.encode('latin-1'), "txt")
+        text, metadata = self.extractor.extract(_ENCODING_TEXT_LATIN1, "txt")
         assert metadata['encoding'] == 'latin-1'
     
     def test_clean_text(self):
@@ -72,54 +101,38 @@ class TestTextExtractor:
         cleaned = self.extractor._clean_text(dirty_text)
         assert cleaned == "This is a test resume"
     
+    def test_clean_text_control_characters(self):
+        """Test control and non-ASCII characters are dropped after whitespace collapse."""
+        dirty_text = "Name:\x00 John\x07\r\nDoeé\x0c"
+        assert self.extractor._clean_text(dirty_text) == "Name: John Doe"
+
     def test_clean_text_empty(self):
         """Test cleaning empty text."""
         assert self.extractor._clean_text("") == ""
         assert self.extractor._clean_text(None) == ""
     
-    @patch('resume_parser.core.extractor.PyPDF2.PdfReader')
-    def test_extract_pdf_success(self, mock_pdf_reader):
+    def test_extract_pdf_success(self, monkeypatch):
         """Test successful PDF extraction."""
-        # Mock PDF reader
-        mock_reader = Mock()
-        mock_reader.is_encrypted = False
-        mock_page = Mock()
-        mock_page.extract_text.return_value = "Test PDF content with more words to meet minimum requirement. " * 25
-        mock_reader.pages = [mock_page]
-        mock_pdf_reader.return_value = mock_reader
+        monkeypatch.setattr('resume_parser.core.extractor.PyPDF2.PdfReader', lambda stream: _PDF_READER)
         
-        content = b"fake pdf content"
-        text, metadata = self.extractor.extract(content, "pdf")
+        text, metadata = self.extractor.extract(_PDF_CONTENT, "pdf")
         
         assert isinstance(text, str)
         assert len(text) > 0
         assert metadata['extraction_method'] == 'pypdf2'
     
-    @patch('resume_parser.core.extractor.PyPDF2.PdfReader')
-    def test_extract_pdf_encrypted(self, mock_pdf_reader):
+    def test_extract_pdf_encrypted(self, monkeypatch):
         """Test PDF extraction with encrypted file."""
-        # Mock encrypted PDF
-        mock_reader = Mock()
-        mock_reader.is_encrypted = True
-        mock_pdf_reader.return_value = mock_reader
+        monkeypatch.setattr('resume_parser.core.extractor.PyPDF2.PdfReader', lambda stream: _ENCRYPTED_PDF_READER)
         
-        content = b"fake encrypted pdf content"
         with pytest.raises(RuntimeError, match="Password-protected PDFs"):
-            self.extractor.extract(content, "pdf")
+            self.extractor.extract(_PDF_CONTENT, "pdf")
     
-    @patch('resume_parser.core.extractor.Document')
-    def test_extract_docx_success(self, mock_document):
+    def test_extract_docx_success(self, monkeypatch):
         """Test successful DOCX extraction."""
-        # Mock DOCX document
-        mock_doc = Mock()
-        mock_paragraph = Mock()
-        mock_paragraph.text = "Test DOCX content with more words to meet minimum requirement. " * 25
-        mock_doc.paragraphs = [mock_paragraph]
-        mock_doc.tables = []
-        mock_document.return_value = mock_doc
+        monkeypatch.setattr('resume_parser.core.extractor.Document', lambda stream: _DOCX_DOCUMENT)
         
-        content = b"fake docx content"
-        text, metadata = self.extractor.extract(content, "docx")
+        text, metadata = self.extractor.extract(_DOCX_CONTENT, "docx")
         
         assert isinstance(text, str)
         assert len(text) > 0
@@ -1,41 +1,80 @@
 """Unit tests for ResumeParser class."""
 
+import time
+import openai
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
-from resume_parser.core.parser import ResumeParser
+from resume_parser.core.parser import (
+    EducationItem, PersonalInfo, Resume, ResumeParser, Skills, WorkExperienceItem
+)
+
+
+def _resume(**overrides):
+    """Build a Resume model shaped like a structured LLM response."""
+    fields = dict(
+        personal_info=PersonalInfo(
+            name="John Doe",
+            email="john.doe@email.com",
+            phone="(555) 123-4567",
+            location="College Park, MD",
+            linkedin_url="https://linkedin.com/in/johndoe",
+            github_url="https://github.com/johndoe",
+        ),
+        education=[EducationItem(
+            institution="University of Technology",
+            degree="Bachelor of Science",
+            field_of_study="Computer Science",
+            start_date="2016",
+            end_date="2020",
+            gpa=3.8,
+        )],
+        work_experience=[
+            WorkExperienceItem(
+                company="TechCorp Inc.",
+                position="Senior Software Engineer",
+                start_date="2022",
+                end_date="Present",
+                description="Led development of microservices architecture",
+            ),
+            WorkExperienceItem(company="StartupXYZ", position="Software Engineer", end_date="2022"),
+        ],
+        skills=Skills(technical_skills=["Python", "React"], soft_skills=["Leadership"]),
+    )
+    fields.update(overrides)
+    return Resume(**fields)
+
+
+def _llm_client(resume):
+    """Build a stub OpenAI client whose structured parse returns *resume*."""
+    client = Mock()
+    client.beta.chat.completions.parse.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(parsed=resume))]
+    )
+    return client
+
 
 class TestResumeParser:
     """Test cases for ResumeParser class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        with patch('resume_parser.core.parser.spacy.load') as mock_spacy:
-            mock_nlp = Mock()
-            mock_doc = Mock()
-            mock_doc.ents = []
-            mock_doc.__len__ = Mock(return_value=200)
-            mock_nlp.return_value = mock_doc
-            mock_spacy.return_value = mock_nlp
-            self.parser = ResumeParser()
-    
-    def test_init_spacy_model_loading(self):
-        """Test spaCy model loading during initialization."""
-        with patch('resume_parser.core.parser.spacy.load') as mock_spacy:
-            mock_nlp = Mock()
-            mock_spacy.return_value = mock_nlp
-            parser = ResumeParser()
-            assert parser.nlp == mock_nlp
+    def test_init_openai_client(self):
+        """Test OpenAI client creation during initialization."""
+        parser = ResumeParser()
+        assert parser.client is openai.OpenAI.return_value
+        assert parser.model == "gpt-4o-mini"
     
-    def test_init_spacy_model_not_found(self):
-        """Test initialization when spaCy model is not available."""
-        with patch('resume_parser.core.parser.spacy.load') as mock_spacy:
-            mock_spacy.side_effect = OSError("Model not found")
-            with pytest.raises(RuntimeError, match="spaCy model not available"):
-                ResumeParser()
+    def test_init_missing_api_key(self, monkeypatch):
+        """Test initialization when no OpenAI API key is configured."""
+        monkeypatch.delenv("OPENAI_API_KEY")
+        monkeypatch.setattr("dotenv.load_dotenv", lambda *args, **kwargs: False)
+        with pytest.raises(ValueError, match="OPENAI_API_KEY is required"):
+            ResumeParser()
     
-    def test_parse_basic_functionality(self, sample_resume_text):
+    def test_parse_basic_functionality(self, parser, sample_resume_text, monkeypatch):
         """Test basic parsing functionality."""
-        result = self.parser.parse(sample_resume_text)
+        monkeypatch.setattr(parser, 'client', _llm_client(_resume()))
+        
+        result = parser.parse(sample_resume_text)
         
         assert isinstance(result, dict)
         assert 'personal_info' in result
@@ -46,228 +85,145 @@ class TestResumeParser:
         
         # Check metadata
         metadata = result['metadata']
-        assert metadata['total_words'] == 200
+        assert metadata['total_words'] == len(sample_resume_text.split())
         assert 'parsing_timestamp' in metadata
         assert 'confidence_overall' in metadata
-        assert 'extraction_method' in metadata
-        assert 'encoding' in metadata
-        assert 'word_count' in metadata
-        assert 'extraction_errors' in metadata
+        assert metadata['extraction_method'] == 'llm-gpt-4o-mini'
+        assert metadata['extraction_errors'] == []
     
-    def test_extract_personal_info_email(self):
-        """Test email extraction from personal info."""
-        text = "Contact: john.doe@example.com"
-        doc = self.parser.nlp(text)
+    def test_parse_sends_text_to_llm(self, parser, monkeypatch):
+        """Test the resume text and output schema are passed to the LLM."""
+        client = _llm_client(_resume())
+        monkeypatch.setattr(parser, 'client', client)
         
-        personal_info = self.parser._extract_personal_info(doc, text)
+        parser.parse("Jane Doe Data Scientist")
         
-        assert personal_info['email']['value'] == 'john.doe@example.com'
-        assert personal_info['email']['confidence'] == 0.95
+        kwargs = client.beta.chat.completions.parse.call_args.kwargs
+        assert kwargs['model'] == "gpt-4o-mini"
+        assert kwargs['response_format'] is Resume
+        assert "Jane Doe Data Scientist" in kwargs['messages'][-1]['content']
     
-    def test_extract_personal_info_phone(self):
-        """Test phone number extraction from personal info."""
-        text = "Phone: (555) 123-4567"
-        doc = self.parser.nlp(text)
-        
-        personal_info = self.parser._extract_personal_info(doc, text)
+    def test_parse_llm_error_propagates(self, parser, monkeypatch):
+        """Test LLM failures are re-raised to the caller."""
+        client = Mock()
+        client.beta.chat.completions.parse.side_effect = RuntimeError("rate limited")
+        monkeypatch.setattr(parser, 'client', client)
         
-        assert personal_info['phone']['value'].strip() == '5551234567'
-        assert personal_info['phone']['confidence'] == 0.9
+        with pytest.raises(RuntimeError, match="rate limited"):
+            parser.parse("Some resume text")
     
-    def test_extract_personal_info_linkedin_url(self):
-        """Test LinkedIn URL extraction from personal info."""
-        text = "LinkedIn: linkedin.com/in/johndoe"
-        doc = self.parser.nlp(text)
+    @patch('resume_parser.core.parser.datetime')
+    def test_parse_timestamp_generation(self, mock_datetime, parser, monkeypatch):
+        """Test that parsing generates proper timestamps."""
+        mock_datetime.now.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+        monkeypatch.setattr(parser, 'client', _llm_client(_resume()))
         
-        personal_info = self.parser._extract_personal_info(doc, text)
+        result = parser.parse("Test resume content")
         
-        assert personal_info['linkedin_url']['value'] == 'linkedin.com/in/johndoe'
-        assert personal_info['linkedin_url']['confidence'] == 0.95
+        assert result['metadata']['parsing_timestamp'] == "2024-01-01T00:00:00"
     
-    def test_extract_personal_info_github_url(self):
-        """Test GitHub URL extraction from personal info."""
-        text = "GitHub: github.com/johndoe"
-        doc = self.parser.nlp(text)
-        
-        personal_info = self.parser._extract_personal_info(doc, text)
+    def test_normalize_personal_info(self, parser):
+        """Test personal info fields are wrapped with confidence scores."""
+        personal_info = parser._normalize_output(_resume(), "")['personal_info']
         
+        assert personal_info['name'] == {'value': 'John Doe', 'confidence': 1.0}
+        assert personal_info['email']['value'] == 'john.doe@email.com'
+        assert personal_info['phone']['value'] == '(555) 123-4567'
+        assert personal_info['location']['value'] == 'College Park, MD'
+        assert personal_info['linkedin_url']['value'] == 'https://linkedin.com/in/johndoe'
         assert personal_info['github_url']['value'] == 'https://github.com/johndoe'
-        assert personal_info['github_url']['confidence'] == 1.0
     
-    def test_extract_personal_info_name_with_entities(self):
-        """Test name extraction using spaCy entities."""
-        text = "John Doe is a software engineer"
-        
-        # Mock spaCy entities
-        mock_ent = Mock()
-        mock_ent.label_ = "PERSON"
-        mock_ent.text = "John Doe"
-        mock_ent.start = 0
-        
-        doc = self.parser.nlp(text)
-        doc.ents = [mock_ent]
-        
-        personal_info = self.parser._extract_personal_info(doc, text)
-        
-        assert personal_info['name']['value'] == 'John Doe'
-        assert personal_info['name']['confidence'] == 0.8
-    
-    def test_extract_education_gpa(self):
-        """Test GPA extraction from education section."""
-        text = "GPA: 3.8/4.0"
-        doc = self.parser.nlp(text)
-        
-        education = self.parser._extract_education(doc, text)
+    def test_normalize_education(self, parser):
+        """Test education items are flattened into the legacy lists."""
+        education = parser._normalize_output(_resume(), "")['education']
         
+        assert education['institutions'] == ['University of Technology']
+        assert education['degrees'] == ['Bachelor of Science']
+        assert education['fields_of_study'] == ['Computer Science']
+        assert education['dates'] == ['2016 - 2020']
         assert education['gpa']['value'] == 3.8
-        assert education['gpa']['confidence'] == 0.9
     
-    def test_extract_education_institutions(self):
-        """Test educational institution extraction."""
-        text = "University of Technology, College of Engineering"
-        
-        # Mock spaCy entities
-        mock_ent1 = Mock()
-        mock_ent1.label_ = "ORG"
-        mock_ent1.text = "University of Technology"
-        
-        mock_ent2 = Mock()
-        mock_ent2.label_ = "ORG"
-        mock_ent2.text = "College of Engineering"
-        
-        doc = self.parser.nlp(text)
-        doc.ents = [mock_ent1, mock_ent2]
+    def test_normalize_education_without_gpa(self, parser):
+        """Test missing optional education fields are skipped."""
+        resume = _resume(education=[EducationItem(institution="Jefferson High School")])
+        education = parser._normalize_output(resume, "")['education']
         
-        education = self.parser._extract_education(doc, text)
-        
-        # Should find institutions with education keywords
-        assert len(education['institutions']) > 0
-        assert education['confidence'] > 0
+        assert education['institutions'] == ['Jefferson High School']
+        assert education['degrees'] == []
+        assert education['fields_of_study'] == []
+        assert education['dates'] == ['']
+        assert education['gpa']['value'] is None
     
-    def test_extract_experience_companies(self):
-        """Test company extraction from experience section."""
-        text = "Worked at Google and Microsoft"
-        
-        # Mock spaCy entities
-        mock_ent1 = Mock()
-        mock_ent1.label_ = "ORG"
-        mock_ent1.text = "Google"
-        
-        mock_ent2 = Mock()
-        mock_ent2.label_ = "ORG"
-        mock_ent2.text = "Microsoft"
+    def test_normalize_experience(self, parser):
+        """Test experience items are flattened into the legacy lists."""
+        experience = parser._normalize_output(_resume(), "")['experience']
         
-        doc = self.parser.nlp(text)
-        doc.ents = [mock_ent1, mock_ent2]
-        
-        experience = self.parser._extract_experience(doc, text)
-        
-        assert len(experience['companies']) >= 2
-        assert experience['confidence'] > 0
+        assert experience['companies'] == ['TechCorp Inc.', 'StartupXYZ']
+        assert experience['positions'] == ['Senior Software Engineer', 'Software Engineer']
+        assert experience['dates'] == ['2022 - Present', '2022']
+        assert experience['descriptions'] == ['Led development of microservices architecture']
     
-    def test_extract_experience_positions(self):
-        """Test job position extraction from experience section."""
-        text = "Software Engineer at Google, Senior Developer at Microsoft"
-        doc = self.parser.nlp(text)
-        
-        experience = self.parser._extract_experience(doc, text)
+    def test_normalize_skills(self, parser):
+        """Test skills are passed through unchanged."""
+        skills = parser._normalize_output(_resume(), "")['skills']
         
-        assert len(experience['positions']) >= 2
-        assert 'Software Engineer' in experience['positions']
-        # The parser extracts individual words, so check for both 'Senior' and 'Developer'
-        assert 'Senior' in experience['positions'] or 'Senior Developer' in experience['positions']
-        assert 'Developer' in experience['positions']
-        assert experience['confidence'] > 0
+        assert skills['technical_skills'] == ['Python', 'React']
+        assert skills['soft_skills'] == ['Leadership']
     
-    def test_extract_skills_technical(self):
-        """Test technical skills extraction."""
-        text = "Skills: Python, Java, React, AWS, Docker"
-        doc = self.parser.nlp(text)
+    def test_normalize_falls_back_to_text_links(self, parser):
+        """Test profile links the LLM missed are recovered from the text."""
+        resume = _resume(personal_info=PersonalInfo(name="John Doe"))
+        text = "John Doe https://www.linkedin.com/in/johndoe https://github.com/johndoe"
         
-        skills = self.parser._extract_skills(doc, text)
+        personal_info = parser._normalize_output(resume, text)['personal_info']
         
-        assert len(skills['technical_skills']) > 0
-        assert 'Python' in skills['technical_skills']
-        assert 'Java' in skills['technical_skills']
-        assert 'React' in skills['technical_skills']
-        assert skills['confidence'] > 0
-    
-    def test_extract_skills_categorization(self):
-        """Test skills categorization."""
-        text = "Python Java React AWS Docker"
-        doc = self.parser.nlp(text)
-        
-        skills = self.parser._extract_skills(doc, text)
-        
-        # Check categorization
-        categories = skills['categories']
-        assert 'Python' in categories['programming_languages']
-        assert 'Java' in categories['programming_languages']
-        assert 'React' in categories['frameworks']
-        assert 'AWS' in categories['cloud_platforms']
-        assert 'Docker' in categories['cloud_platforms']
+        assert personal_info['linkedin_url']['value'] == 'https://www.linkedin.com/in/johndoe'
+        assert personal_info['github_url']['value'] == 'https://github.com/johndoe'
     
-    def test_extract_skills_soft_skills(self):
-        """Test soft skills extraction."""
-        text = "Leadership, Communication, Teamwork, Problem Solving"
-        doc = self.parser.nlp(text)
+    def test_normalize_prefers_llm_links(self, parser):
+        """Test links returned by the LLM are not replaced by the text fallback."""
+        text = "https://linkedin.com/in/someone-else https://github.com/someone-else"
         
-        skills = self.parser._extract_skills(doc, text)
+        personal_info = parser._normalize_output(_resume(), text)['personal_info']
         
-        assert len(skills['soft_skills']) > 0
-        assert 'Leadership' in skills['soft_skills']
-        assert 'Communication' in skills['soft_skills']
-        assert 'Teamwork' in skills['soft_skills']
-        assert 'Problem Solving' in skills['soft_skills']
-    
-    def test_get_confidence_score_empty_data(self):
-        """Test confidence score calculation with empty data."""
-        score = self.parser.get_confidence_score({})
-        assert score == 0.0
+        assert personal_info['linkedin_url']['value'] == 'https://linkedin.com/in/johndoe'
+        assert personal_info['github_url']['value'] == 'https://github.com/johndoe'
     
-    def test_get_confidence_score_with_data(self):
-        """Test confidence score calculation with valid data."""
-        data = {
-            'personal_info': {'confidence': 0.8},
-            'education': {'confidence': 0.6},
-            'experience': {'confidence': 0.7},
-            'skills': {'confidence': 0.9}
-        }
+    def test_normalize_metadata(self, parser):
+        """Test parsing metadata is derived from the original text."""
+        metadata = parser._normalize_output(_resume(), "one two three")['metadata']
         
-        score = self.parser.get_confidence_score(data)
-        assert abs(score - 0.75) < 0.001  # (0.8 + 0.6 + 0.7 + 0.9) / 4
-    
-    def test_pattern_initialization(self):
-        """Test that regex patterns are properly initialized."""
-        assert hasattr(self.parser, 'email_pattern')
-        assert hasattr(self.parser, 'phone_pattern')
-        assert hasattr(self.parser, 'linkedin_pattern')
-        assert hasattr(self.parser, 'github_patterns')
-        assert hasattr(self.parser, 'date_patterns')
-        assert hasattr(self.parser, 'gpa_pattern')
-        assert hasattr(self.parser, 'skill_patterns')
+        assert metadata['total_words'] == 3
+        assert metadata['extraction_method'] == 'llm-gpt-4o-mini'
+        assert metadata['extraction_errors'] == []
     
-    def test_parse_with_empty_text(self):
-        """Test parsing with empty text."""
-        result = self.parser.parse("")
+    def test_parse_batch_preserves_order(self, parser, monkeypatch):
+        """Test batch results come back in input order despite completion order."""
+        def fake_parse(text):
+            # Earlier inputs finish last
+            time.sleep(0.01 * (3 - int(text)))
+            return {'text': text}
+        monkeypatch.setattr(parser, 'parse', fake_parse)
         
-        assert isinstance(result, dict)
-        assert result['metadata']['total_words'] == 200  # Mock returns 200
-        assert result['metadata']['confidence_overall'] == 0.0
-    
-    def test_parse_with_minimal_text(self):
-        """Test parsing with minimal text."""
-        result = self.parser.parse("Hello world")
+        results = parser.parse_batch(["0", "1", "2"])
         
-        assert isinstance(result, dict)
-        assert result['metadata']['total_words'] == 200  # Mock returns 200
-        assert result['metadata']['confidence_overall'] == 0.0
+        assert results == [{'text': "0"}, {'text': "1"}, {'text': "2"}]
     
-    @patch('resume_parser.core.parser.datetime')
-    def test_parse_timestamp_generation(self, mock_datetime):
-        """Test that parsing generates proper timestamps."""
-        mock_datetime.now.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+    def test_parse_batch_partial_failure(self, parser, monkeypatch):
+        """Test one failed LLM call does not discard the other results."""
+        def fake_parse(text):
+            if text == "bad":
+                raise RuntimeError("LLM request failed")
+            return {'text': text}
+        monkeypatch.setattr(parser, 'parse', fake_parse)
         
-        result = self.parser.parse("Test resume content")
+        results = parser.parse_batch(["first", "bad", "last"])
         
-        assert result['metadata']['parsing_timestamp'] == "2024-01-01T00:00:00"
+        assert results[0] == {'text': "first"}
+        assert isinstance(results[1], RuntimeError)
+        assert str(results[1]) == "LLM request failed"
+        assert results[2] == {'text': "last"}
+    
+    def test_parse_batch_empty(self, parser):
+        """Test an empty batch makes no requests."""
+        assert parser.parse_batch([]) == []